@@ -1,12 +1,11 @@
-import json
+import orjson
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 import matplotlib.patches as mpatches
 import seaborn as sns
-from matplotlib.colors import to_rgb
-import datetime
+from matplotlib.colors import ListedColormap
 
 # --- CONFIGURATION ---
 FILENAME = "repo_aware_history.json"
@@ -19,41 +18,71 @@ TOP_N = 114  # How many distinct colors to show in charts
 
 def load_data():
     try:
-        with open(FILENAME, "r") as f:
-            return json.load(f)
+        with open(FILENAME, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"❌ '{FILENAME}' not found. Run read.py first!")
         exit()
 
 
-def hex_to_rgb_norm(hex_col):
-    return to_rgb(hex_col)
-
-
 def create_dashboard():
     print("🎨 Generating Deep-Dive Dashboard...")
     data = load_data()
 
     # --- DATA PREP ---
-    df = pd.DataFrame(data["detailed_commits"])
-    df = df.rename(columns={"date": "iso_date", "repo": "repo_name"})
+    # The export is columnar, so the DataFrame assembles straight from the
+    # arrays with no record-to-column conversion.
+    df = pd.DataFrame(
+        {
+            "iso_date": data["dates"],
+            # Integer category codes make every repo groupby below hash
+            # small ints instead of strings (and store each name once).
+            "repo_name": pd.Categorical(data["repos"]),
+            "additions": np.asarray(data["additions"], dtype=np.int32),
+            "deletions": np.asarray(data["deletions"], dtype=np.int32),
+        }
+    )
 
     # Date Conversions
     df["dt"] = pd.to_datetime(df["iso_date"], utc=True).dt.tz_convert(
         "America/Edmonton"
     )
-    df["date"] = df["dt"].dt.date
-    df["year"] = df["dt"].dt.year
-    df["month_year"] = df["dt"].dt.to_period("M")
-    df["hour"] = df["dt"].dt.hour
-    df["weekday"] = df["dt"].dt.day_name()
+
+    # One pass over the int64 ns array instead of six .dt accessors
+    # (dt.date / dt.year / dt.hour / day_name / strftime are the slow paths).
+    # Drop the tz first so we work in local wall-clock time, and force ns
+    # resolution: pandas 3 parses ISO strings as datetime64[us], which would
+    # silently break the ns-based divisions below.
+    ns = df["dt"].dt.tz_localize(None).to_numpy().astype("datetime64[ns]").view("i8")
+    days = ns // 86_400_000_000_000  # days since epoch
+    dates64 = days.astype("datetime64[D]")
+
+    df["date"] = dates64
+    df["year"] = (dates64.astype("datetime64[Y]").view("i8") + 1970).astype("int16")
+    df["hour"] = ((ns // 3_600_000_000_000) % 24).astype("int8")
+    # Unix epoch (day 0) was a Thursday; 0=Mon .. 6=Sun
+    weekday = (days + 3) % 7
+    df["short_day"] = np.array(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])[
+        weekday
+    ]
 
     # --- PALETTE GENERATION ---
     # Identify top repos by "Impact" (Lines Changed), not just commit count
     # This highlights the projects where the real work happened.
-    df["total_impact"] = df["additions"] + df["deletions"]
+    # Keep the hottest column at 4 bytes/row; int32 holds ~2.1B changed
+    # lines, far beyond any real history
+    df["total_impact"] = (df["additions"] + df["deletions"]).astype("int32")
+    # One (month, repo) pass feeds both the streamgraph and, via a further
+    # reduction, the per-repo impact ranking — no second full scan.
+    # Month-start Grouper on the datetime column takes the C resample path;
+    # Period-object keys would fall back to a much slower groupby.
+    monthly_repo = df.groupby(
+        [pd.Grouper(key="dt", freq="MS"), "repo_name"], observed=True
+    )["total_impact"].sum()
     impact_by_repo = (
-        df.groupby("repo_name")["total_impact"].sum().sort_values(ascending=False)
+        monthly_repo.groupby(level="repo_name", observed=True)
+        .sum()
+        .sort_values(ascending=False)
     )
 
     top_repos_list = impact_by_repo.head(TOP_N).index.tolist()
@@ -131,23 +160,31 @@ def create_dashboard():
 
     # Logic: Identify the "Dominant" repo for each day to assign color
     daily_repo_counts = (
-        df.groupby(["date", "repo_name"])["total_impact"].sum().reset_index()
+        df.groupby(["date", "repo_name"], observed=True)["total_impact"]
+        .sum()
+        .reset_index()
     )
-    daily_repo_counts = daily_repo_counts.sort_values(
-        ["date", "total_impact"], ascending=[True, False]
+    # idxmax per day beats sort + drop_duplicates: O(N) reduction, no global sort
+    idx = daily_repo_counts.groupby("date")["total_impact"].idxmax()
+    # One date-indexed series maps day -> dominant repo for the whole span
+    # (object dtype so the "Other" bucket can be written in below)
+    date_to_repo = daily_repo_counts.loc[idx].set_index("date")["repo_name"].astype(
+        object
     )
-    daily_top = daily_repo_counts.drop_duplicates(subset="date")
-    date_to_repo = dict(zip(daily_top["date"], daily_top["repo_name"]))
 
-    bg_rgb = hex_to_rgb_norm(THEME_BG)
-    # Grid: [Rows (Years * 9), Cols (53 weeks), RGB]
-    total_rows = (n_years * 8) + ((n_years - 1) * 2)
-    grid = np.full((total_rows, 53, 3), bg_rgb)
+    # Grid of uint8 colour ids instead of float RGB triples: one byte per
+    # cell, and imshow applies the palette via a ListedColormap.
+    # Ids: 0..len(top)-1 = repos, then Other, empty day, background.
+    id_order = top_repos_list + ["Other"]
+    empty_id = len(id_order)
+    bg_id = empty_id + 1
+    repo_to_id = {name: i for i, name in enumerate(id_order)}
 
-    for i, year in enumerate(years):
-        y_offset = i * 9
-        start_date = datetime.date(year, 1, 1)
+    total_rows = (n_years * 8) + ((n_years - 1) * 2)
+    grid = np.full((total_rows, 53), bg_id, dtype=np.uint8)
 
+    year_to_row = {year: i * 9 for i, year in enumerate(years)}
+    for year, y_offset in year_to_row.items():
         # Year Label
         ax_heat.text(
             -1.5,
@@ -160,25 +197,36 @@ def create_dashboard():
             va="center",
         )
 
-        for d_ord in range(366):
-            d = start_date + datetime.timedelta(days=d_ord)
-            if d.year != year:
-                continue
-
-            week = int(d.strftime("%W"))
-            day = d.weekday()  # 0=Mon, 6=Sun
-
-            if week < 53:
-                if d in date_to_repo:
-                    r_name = date_to_repo[d]
-                    if r_name not in top_repos_list:
-                        r_name = "Other"
-                    grid[y_offset + day, week] = hex_to_rgb_norm(repo_color_map[r_name])
-                else:
-                    # Subtle dot for empty days to keep structure
-                    grid[y_offset + day, week] = hex_to_rgb_norm("#161b22")
-
-    ax_heat.imshow(grid, aspect="equal", interpolation="nearest")
+    # Vectorized grid fill: compute week/weekday for the whole span at once
+    # instead of ~366 strftime calls per year in a Python loop.
+    all_days = pd.date_range(f"{min(years)}-01-01", f"{max(years)}-12-31", freq="D")
+    weekday = all_days.weekday.to_numpy()  # 0=Mon, 6=Sun
+    # Same week numbering as strftime("%W") (Monday-first, week 0 padding)
+    week = (all_days.dayofyear.to_numpy() + 6 - weekday) // 7
+
+    dominant = date_to_repo.reindex(all_days)
+    dominant = dominant.where(dominant.isin(top_repos_list) | dominant.isna(), "Other")
+    # Subtle dot for empty days to keep structure
+    ids_per_day = dominant.map(repo_to_id).fillna(empty_id).to_numpy(dtype=np.uint8)
+
+    row_offset = pd.Series(all_days.year).map(year_to_row).to_numpy()
+    valid = (week < 53) & ~pd.isna(row_offset)
+    grid[row_offset[valid].astype(np.intp) + weekday[valid], week[valid]] = ids_per_day[
+        valid
+    ]
+
+    # ListedColormap takes the hex strings directly; no float RGB conversion
+    heat_cmap = ListedColormap(
+        [repo_color_map[r] for r in id_order] + ["#161b22", THEME_BG]
+    )
+    ax_heat.imshow(
+        grid,
+        cmap=heat_cmap,
+        vmin=0,
+        vmax=bg_id,
+        aspect="equal",
+        interpolation="nearest",
+    )
     ax_heat.axis("off")
     ax_heat.set_title(
         "DAILY DOMINANCE (Primary Project per Day)",
@@ -192,7 +240,6 @@ def create_dashboard():
     ax_punch = fig.add_subplot(gs[2, 1:3])
 
     day_order = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    df["short_day"] = df["dt"].dt.strftime("%a")
     df["short_day"] = pd.Categorical(
         df["short_day"], categories=day_order, ordered=True
     )
@@ -268,12 +315,8 @@ def create_dashboard():
     # ==========================
     ax_stream = fig.add_subplot(gs[3, 1:])
 
-    # Aggregation: Sum Impact by Month and Repo
-    df_monthly = (
-        df.groupby(["month_year", "repo_name"])["total_impact"]
-        .sum()
-        .unstack(fill_value=0)
-    )
+    # Aggregation: reuse the (month, repo) sums computed for the palette
+    df_monthly = monthly_repo.unstack(fill_value=0)
 
     # Filter to top N repos, sum others
     main_cols = [c for c in df_monthly.columns if c in top_repos_list]
@@ -285,8 +328,8 @@ def create_dashboard():
     # Smooth data for "Flow" look (Rolling average)
     df_stream = df_stream.rolling(window=2, min_periods=1).mean()
 
-    # Prepare stackplot data
-    x = df_stream.index.to_timestamp()
+    # Prepare stackplot data (index is already a DatetimeIndex)
+    x = df_stream.index
     y = [df_stream[col].values for col in df_stream.columns]
     labels = df_stream.columns
     colors = [repo_color_map.get(col, "#3d444d") for col in df_stream.columns]
@@ -324,7 +367,9 @@ def create_dashboard():
     )
 
     # --- SAVE ---
-    output_filename = "engineering_dna_profile.svg"
+    # Raster PNG: the heatmap image + thousands of streamgraph vertices make
+    # SVG output huge and slow to render in browsers
+    output_filename = "engineering_dna_profile.png"
     plt.savefig(output_filename, facecolor=THEME_BG, dpi=150, bbox_inches="tight")
     print(f"✅ DNA Profile Generated: '{output_filename}'")
 
@@ -1,13 +1,35 @@
+import asyncio
+import hashlib
 import os
 import subprocess
-import json
+import warnings
+from array import array
+import numpy as np
+import orjson
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Optional accelerator: when numba is installed the numstat hot loop runs
+# as a compiled kernel over the raw bytes instead of the Python token loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # --- CONFIGURATION ---
 ROOT_DIR = os.path.expanduser("~/Development")
 OUTPUT_FILE = "repo_aware_history.json"
 
+# Mining strategy. The process pool parallelizes parsing across cores; the
+# asyncio mode keeps a single process and overlaps the git subprocess IO
+# instead (no fork/pickling — handy on network disks or odd interpreters).
+USE_ASYNCIO = False
+
+# Parsed logs are cached here keyed by HEAD, so unchanged repos are free
+# on re-runs
+CACHE_DIR = os.path.join(os.path.expanduser("~/.cache"), "git-wrapped")
+
 # Update with your identities
 MY_EMAILS = {
     "your email",
@@ -55,6 +77,27 @@ EXTENSIONS = {
 }
 
 
+# Dependency-heavy folders that never contain repos worth scanning
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "venv",
+        ".venv",
+        "target",
+        "dist",
+        "build",
+        "vendor",
+        "deps",
+        "__pycache__",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "site-packages",
+    }
+)
+
+
 def get_git_repos(root):
     print(f"📂 Scanning {root} for repositories...")
     git_repos = []
@@ -63,26 +106,16 @@ def get_git_repos(root):
             git_repos.append(dirpath)
             dirnames[:] = []
             continue
-        # Skip dependency heavy folders
-        for skip in [
-            ".git",
-            "node_modules",
-            "venv",
-            "target",
-            "dist",
-            "build",
-            "vendor",
-            "deps",
-            "__pycache__",
-        ]:
-            if skip in dirnames:
-                dirnames.remove(skip)
+        # Prune dependency-heavy and hidden folders before descending
+        dirnames[:] = [
+            d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")
+        ]
     return git_repos
 
 
 # --- ADD THIS TO YOUR CONFIGURATION SECTION ---
 # Files that represent "Data" or "Dependencies", not "Code"
-IGNORE_EXTENSIONS = {
+IGNORE_EXTENSIONS = frozenset({
     ".lock",  # Dependency locks
     ".svg",  # Vector graphics (often massive XMLs)
     ".map",  # JS Source maps
@@ -98,9 +131,9 @@ IGNORE_EXTENSIONS = {
     ".gif",
     ".ico",
     ".webp",  # Binaries that might slip through
-}
+})
 
-IGNORE_EXACT_FILES = {
+IGNORE_EXACT_FILES = frozenset({
     "package-lock.json",
     "yarn.lock",
     "pnpm-lock.yaml",
@@ -108,88 +141,439 @@ IGNORE_EXACT_FILES = {
     "Cargo.lock",
     "Gemfile.lock",
     "poetry.lock",
-}
+})
+
+# Byte-string twins of the ignore sets so the numstat hot path never has to
+# decode filenames.
+_IGNORE_EXACT_FILES_B = frozenset(n.encode() for n in IGNORE_EXACT_FILES)
+_IGNORE_EXTENSIONS_B = frozenset(e.encode() for e in IGNORE_EXTENSIONS)
+
+
+def _nul_tokens(stream, chunk_size=1 << 16):
+    """Yields NUL-delimited byte tokens from a stream without buffering it all."""
+    buf = b""
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        buf += data
+        tokens = buf.split(b"\0")
+        buf = tokens.pop()
+        yield from tokens
+    if buf:
+        yield buf
+
+
+def _pad_byte_rows(names):
+    """Packs byte strings into a padded uint8 matrix + lengths for the kernel."""
+    width = max(len(n) for n in names)
+    mat = np.zeros((len(names), width), dtype=np.uint8)
+    lens = np.zeros(len(names), dtype=np.int64)
+    for i, n in enumerate(names):
+        mat[i, : len(n)] = np.frombuffer(n, dtype=np.uint8)
+        lens[i] = len(n)
+    return mat, lens
+
+
+if njit is not None:
+    _EXACT_MAT, _EXACT_LENS = _pad_byte_rows(sorted(_IGNORE_EXACT_FILES_B))
+    _EXT_MAT, _EXT_LENS = _pad_byte_rows(sorted(_IGNORE_EXTENSIONS_B))
+
+    @njit(cache=True)
+    def _sum_numstat(body, exact_mat, exact_lens, ext_mat, ext_lens):
+        """
+        Walks one commit's numstat body ("added TAB deleted TAB path" tokens,
+        NUL-terminated; renames are "added TAB deleted TAB" followed by two
+        bare path tokens) and returns (additions, deletions, files), applying
+        the same exact-name and extension ignore rules as the Python path.
+        """
+        additions = 0
+        deletions = 0
+        files = 0
+        n = body.shape[0]
+        i = 0
+        while i < n:
+            # Skip token padding (record NULs and the header's newline)
+            while i < n and (body[i] == 0 or body[i] == 10):
+                i += 1
+            if i >= n:
+                break
+            end = i
+            while end < n and body[end] != 0:
+                end += 1
+
+            j = i
+            ok = True
+            added = 0
+            added_binary = body[j] == 45  # '-'
+            if added_binary:
+                j += 1
+            else:
+                has_digit = False
+                while j < end and 48 <= body[j] <= 57:
+                    added = added * 10 + (body[j] - 48)
+                    j += 1
+                    has_digit = True
+                ok = has_digit
+            if ok and j < end and body[j] == 9:  # '\t'
+                j += 1
+            else:
+                ok = False
+
+            deleted = 0
+            deleted_binary = False
+            if ok:
+                deleted_binary = body[j] == 45
+                if deleted_binary:
+                    j += 1
+                else:
+                    has_digit = False
+                    while j < end and 48 <= body[j] <= 57:
+                        deleted = deleted * 10 + (body[j] - 48)
+                        j += 1
+                        has_digit = True
+                    ok = has_digit
+            if ok and j < end and body[j] == 9:
+                j += 1
+            else:
+                ok = False
+
+            if ok and j == end:
+                # Rename entry "N\tM\t": the counts stand alone, and the two
+                # bare path tokens that follow are consumed here so they can
+                # never be re-parsed as numstat tokens
+                if not added_binary:
+                    additions += added
+                if not deleted_binary:
+                    deletions += deleted
+                files += 1
+                end += 1
+                while end < n and body[end] != 0:  # old path
+                    end += 1
+                end += 1
+                while end < n and body[end] != 0:  # new path
+                    end += 1
+            elif ok and j < end:
+                pstart = j
+                pend = end
+                # basename = everything after the last '/'
+                bstart = pstart
+                for k in range(pend - 1, pstart - 1, -1):
+                    if body[k] == 47:  # '/'
+                        bstart = k + 1
+                        break
+                blen = pend - bstart
+
+                ignored = False
+                for r in range(exact_mat.shape[0]):
+                    if exact_lens[r] == blen:
+                        match = True
+                        for k in range(blen):
+                            if exact_mat[r, k] != body[bstart + k]:
+                                match = False
+                                break
+                        if match:
+                            ignored = True
+                            break
+
+                if not ignored:
+                    # Last '.' strictly after bstart, so dotfiles keep no ext
+                    dot = -1
+                    for k in range(pend - 1, bstart, -1):
+                        if body[k] == 46:  # '.'
+                            dot = k
+                            break
+                    if dot != -1:
+                        elen = pend - dot
+                        for r in range(ext_mat.shape[0]):
+                            if ext_lens[r] == elen:
+                                match = True
+                                for k in range(elen):
+                                    c = body[dot + k]
+                                    if 65 <= c <= 90:  # ASCII lower
+                                        c += 32
+                                    if ext_mat[r, k] != c:
+                                        match = False
+                                        break
+                                if match:
+                                    ignored = True
+                                    break
+
+                if not ignored:
+                    if not added_binary:
+                        additions += added
+                    if not deleted_binary:
+                        deletions += deleted
+                    files += 1
+
+            i = end + 1
+        return additions, deletions, files
+
+
+# Format: HEADER NUL HASH NUL ISO_DATE NUL AUTHOR NUL EMAIL NUL
+LOG_ARGS = [
+    "log",
+    "--all",
+    "--no-merges",
+    "-z",
+    "--format=HEADER%x00%H%x00%aI%x00%an%x00%ae%x00",
+    "--numstat",
+]
+
+
+def _is_sha_field(field):
+    """True if a record's first NUL field looks like a commit sha (%H)."""
+    return len(field) in (40, 64) and all(c in b"0123456789abcdef" for c in field)
+
+
+def _parse_log_records_jit(raw):
+    """Numba path: split the raw log bytes on the HEADER sentinel and hand
+    each kept commit's body to the compiled kernel."""
+    hashes = []
+    dates = []
+    adds = array("i")
+    dels = array("i")
+
+    if raw.startswith(b"HEADER\0"):
+        raw = raw[len(b"HEADER\0") :]
+
+    # A bare rename path literally named "HEADER" fakes the record sentinel.
+    # Such false splits leave a piece that does not start with a commit sha:
+    # either the swallowed sentinel sat mid-record (glue the piece back
+    # verbatim), or the path abutted the genuine sentinel, in which case the
+    # piece starts with "HEADER\0<sha>" — return the path to the previous
+    # record and open a new one at the sha
+    records = []
+    for piece in raw.split(b"\0HEADER\0"):
+        while True:
+            if not records or _is_sha_field(piece.split(b"\0", 1)[0]):
+                records.append(piece)
+                break
+            if piece == b"HEADER" or piece.startswith(b"HEADER\0"):
+                records[-1] += b"\0HEADER"
+                piece = piece[len(b"HEADER\0") :]
+                if not piece:
+                    break
+                continue
+            records[-1] += b"\0HEADER\0" + piece
+            break
+
+    for record in records:
+        parts = record.split(b"\0", 4)
+        if len(parts) == 4:
+            parts.append(b"")  # commit with no numstat body
+        elif len(parts) < 4:
+            continue
+        sha, date, name, email, body = parts
+
+        name = name.decode("utf-8", "replace").strip()
+        email = email.decode("utf-8", "replace").strip().lower()
+        if not is_me(name, email):
+            continue
+
+        additions, deletions, _files = _sum_numstat(
+            np.frombuffer(body, dtype=np.uint8),
+            _EXACT_MAT,
+            _EXACT_LENS,
+            _EXT_MAT,
+            _EXT_LENS,
+        )
+        hashes.append(sha.decode("ascii"))
+        dates.append(date.decode("ascii"))
+        adds.append(additions)
+        dels.append(deletions)
+
+    return hashes, dates, adds, dels
+
+
+def _parse_log_tokens(tokens):
+    """Pure-Python path: consumes NUL-delimited tokens (streamed or from a
+    pre-split list) and returns the commit columns."""
+    hashes = []
+    dates = []
+    adds = array("i")
+    dels = array("i")
+    keep = False
+
+    for token in tokens:
+        if token == b"HEADER":
+            keep = False
+
+            try:
+                sha, date, name, email = (
+                    next(tokens),
+                    next(tokens),
+                    next(tokens),
+                    next(tokens),
+                )
+            except StopIteration:
+                break
+
+            name = name.decode("utf-8", "replace").strip()
+            email = email.decode("utf-8", "replace").strip().lower()
+
+            # Not our commit: leave keep unset so every numstat token
+            # in the body is dropped without parsing
+            if not is_me(name, email):
+                continue
+
+            keep = True
+            hashes.append(sha.decode("ascii"))
+            dates.append(date.decode("ascii"))
+            adds.append(0)
+            dels.append(0)
+        else:
+            # Rename entries are "N\tM\t" plus two bare path tokens; always
+            # consume the paths (even in skipped commits) so a file
+            # literally named "HEADER" cannot fake a record boundary
+            if token.endswith(b"\t"):
+                parts = token.lstrip(b"\n").split(b"\t", 2)
+                if len(parts) == 3 and parts[2] == b"":
+                    next(tokens, None)  # old path
+                    next(tokens, None)  # new path
+                    if keep:
+                        added, deleted = parts[0], parts[1]
+                        if added != b"-":
+                            adds[-1] += int(added)
+                        if deleted != b"-":
+                            dels[-1] += int(deleted)
+                    continue
+
+            if not keep:
+                continue
+
+            # Numstat token: b"10\t5\tsrc/main.py" (first one per commit
+            # carries the newline git prints after the header block)
+            parts = token.lstrip(b"\n").split(b"\t", 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, filename = parts
+
+            # --- FILTERING LOGIC ---
+            # 1. Check exact filenames (like package-lock.json)
+            basename = filename.rpartition(b"/")[2]
+            if basename in _IGNORE_EXACT_FILES_B:
+                continue
+
+            # 2. Check extensions (like .csv, .map)
+            stem, dot, ext = basename.rpartition(b".")
+            if stem and dot and b"." + ext.lower() in _IGNORE_EXTENSIONS_B:
+                continue
+            # -----------------------
+
+            if added != b"-":
+                adds[-1] += int(added)
+            if deleted != b"-":
+                dels[-1] += int(deleted)
+
+    return hashes, dates, adds, dels
+
+
+def _parse_log_bytes(raw):
+    """Parses a fully captured log blob with whichever parser is available."""
+    if njit is not None:
+        return _parse_log_records_jit(raw)
+    return _parse_log_tokens(iter(raw.split(b"\0")))
+
+
+def _repo_head(repo_path):
+    """HEAD sha of a repo, or None (e.g. no commits yet)."""
+    res = subprocess.run(
+        ["git", "-C", repo_path, "rev-parse", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    head = res.stdout.decode("ascii", "replace").strip()
+    return head if res.returncode == 0 and head else None
+
+
+def _cache_key(repo_path):
+    # The identities are part of the key: re-running with different
+    # MY_EMAILS / MY_NAMES must not reuse commits filtered for someone else
+    raw = "|".join([repo_path, *sorted(MY_EMAILS), *sorted(MY_NAMES)])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _load_cached_log(repo_path, head):
+    try:
+        path = os.path.join(CACHE_DIR, f"{_cache_key(repo_path)}-{head}.json")
+        with open(path, "rb") as f:
+            hashes, dates, adds, dels = orjson.loads(f.read())
+        return hashes, dates, array("i", adds), array("i", dels)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_log(repo_path, head, columns):
+    key = _cache_key(repo_path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Drop entries for older heads of the same repo
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(key + "-"):
+                os.unlink(os.path.join(CACHE_DIR, name))
+        hashes, dates, adds, dels = columns
+        with open(os.path.join(CACHE_DIR, f"{key}-{head}.json"), "wb") as f:
+            f.write(orjson.dumps([hashes, dates, list(adds), list(dels)]))
+    except OSError:
+        pass
 
 
 # --- REPLACE YOUR EXISTING parse_git_log FUNCTION WITH THIS ---
 def parse_git_log(repo_path):
     """
     Parses git log with --numstat.
-    UPDATED: Now filters out lockfiles, assets, and data files.
+    NUL-delimited (-z + %x00) so author names with '|' or pathological
+    filenames can never corrupt record boundaries, and the hot path stays
+    in bytes without per-line UTF-8 decoding. With numba installed the
+    numstat summing runs in a compiled kernel; otherwise stdout is streamed
+    through the pure-Python token parser.
+
+    Returns parallel columns (hashes, dates, additions, deletions) rather
+    than one dict per commit, so per-commit allocations stay flat.
+
+    Results are cached on disk keyed by HEAD, so unchanged repos skip the
+    log walk entirely on later runs.
     """
-    commits = []
+    head = _repo_head(repo_path)
+    if head:
+        cached = _load_cached_log(repo_path, head)
+        if cached is not None:
+            return cached
 
-    # Format: HASH | ISO_DATE | AUTHOR | EMAIL
-    cmd = [
-        "git",
-        "-C",
-        repo_path,
-        "log",
-        "--all",
-        "--no-merges",
-        "--format=HEADER|%H|%aI|%an|%ae",
-        "--numstat",
-    ]
+    cmd = ["git", "-C", repo_path] + LOG_ARGS
 
     try:
-        # errors='replace' handles non-utf8 characters
-        result = subprocess.run(cmd, capture_output=True, text=True, errors="replace")
-        current_commit = None
-
-        for line in result.stdout.splitlines():
-            if line.startswith("HEADER|"):
-                # Save previous commit
-                if current_commit:
-                    if is_me(current_commit["name"], current_commit["email"]):
-                        commits.append(current_commit)
-
-                parts = line.split("|")
-                current_commit = {
-                    "hash": parts[1],
-                    "date": parts[2],
-                    "name": parts[3].strip(),
-                    "email": parts[4].strip().lower(),
-                    "additions": 0,
-                    "deletions": 0,
-                    "files": 0,
-                }
-            elif current_commit and line.strip():
-                # Parse numstat: "10  5   src/main.py"
-                try:
-                    # distinct split to handle filenames with spaces correctly
-                    parts = line.split(maxsplit=2)
-                    if len(parts) >= 3:
-                        added = parts[0]
-                        deleted = parts[1]
-                        filename = parts[2].strip()
-
-                        # --- NEW FILTERING LOGIC ---
-                        # 1. Check exact filenames (like package-lock.json)
-                        if os.path.basename(filename) in IGNORE_EXACT_FILES:
-                            continue
-
-                        # 2. Check extensions (like .csv, .map)
-                        _, ext = os.path.splitext(filename)
-                        if ext.lower() in IGNORE_EXTENSIONS:
-                            continue
-                        # ---------------------------
-
-                        if added != "-":
-                            current_commit["additions"] += int(added)
-                        if deleted != "-":
-                            current_commit["deletions"] += int(deleted)
-                        current_commit["files"] += 1
-                except ValueError:
-                    pass
-
-        # Append last commit
-        if current_commit and is_me(current_commit["name"], current_commit["email"]):
-            commits.append(current_commit)
+        if njit is not None:
+            res = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            columns = _parse_log_records_jit(res.stdout)
+            if res.returncode != 0:
+                print(f"git log failed for {repo_path} (exit {res.returncode})")
+                return columns
+        else:
+            # Stream stdout instead of buffering the whole log in memory
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=1 << 16,
+            )
+            columns = _parse_log_tokens(_nul_tokens(proc.stdout))
+
+            proc.wait()
+            if proc.returncode != 0:
+                print(f"git log failed for {repo_path} (exit {proc.returncode})")
+                return columns
 
     except Exception as e:
         print(f"Error parsing log for {repo_path}: {e}")
+        return [], [], array("i"), array("i")
 
-    return commits
+    if head:
+        _store_cached_log(repo_path, head, columns)
+    return columns
 
 
 def is_me(name, email):
@@ -201,100 +585,169 @@ def is_me(name, email):
     return False
 
 
-def get_current_languages(repo_path):
+def _languages_from_listing(listing):
     languages = defaultdict(int)
+    for file in listing.splitlines():
+        ext = os.path.splitext(file)[1].lower()
+        if ext in EXTENSIONS:
+            languages[EXTENSIONS[ext]] += 1
+    return languages
+
+
+def get_current_languages(repo_path):
     cmd_files = ["git", "-C", repo_path, "ls-files"]
     try:
         res = subprocess.run(
             cmd_files, capture_output=True, text=True, errors="replace"
         )
-        for file in res.stdout.splitlines():
-            ext = os.path.splitext(file)[1].lower()
-            if ext in EXTENSIONS:
-                languages[EXTENSIONS[ext]] += 1
+        return _languages_from_listing(res.stdout)
     except:
-        pass
-    return languages
+        return defaultdict(int)
 
 
-def estimate_hours(commits):
+def estimate_hours(iso_dates):
     """
-    Heuristic: Sort all commits by time.
+    Heuristic: Sort all commit timestamps.
     If diff < 2 hours, add diff. If diff > 2 hours, add 1 hour (start of session).
     """
-    if not commits:
+    if not iso_dates:
         return 0
 
-    # Sort by date
-    dates = sorted([datetime.fromisoformat(c["date"]) for c in commits])
+    with warnings.catch_warnings():
+        # numpy folds the ISO offsets into UTC, which is all the diff
+        # heuristic needs — silence its timezone representation warning
+        warnings.simplefilter("ignore", UserWarning)
+        dates = np.array(iso_dates, dtype="datetime64[s]")
+    dates.sort()
+
+    diffs = np.diff(dates).astype("int64")
+    # < 2 hours: still the same session; otherwise assume a new session
+    # worth 1 hour. Plus the initial 1-hour session for the first commit.
+    total_seconds = 3600 + int(np.where(diffs < 7200, diffs, 3600).sum())
+
+    return total_seconds / 3600
+
+
+def analyze_repo(repo_path):
+    """
+    Worker for the process pool: mines one repo's history + language snapshot.
+    Must stay a top-level function so it is picklable.
+    """
+    repo_name = os.path.basename(repo_path)
+    commits = parse_git_log(repo_path)
+    langs = get_current_languages(repo_path)
+    return repo_name, commits, langs
 
-    total_seconds = 0
-    # Initial session assumption (1 hour for the first commit)
-    total_seconds += 3600
 
-    for i in range(1, len(dates)):
-        diff = (dates[i] - dates[i - 1]).total_seconds()
-        if diff < 7200:  # 2 hours
-            total_seconds += diff
+async def _git_bytes(repo_path, *args):
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "-C",
+        repo_path,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await proc.communicate()
+    return stdout, proc.returncode
+
+
+async def _analyze_repo_async(repo_path, sem):
+    """asyncio twin of analyze_repo: both git invocations for a repo run
+    concurrently, and the semaphore bounds how many repos are in flight."""
+    async with sem:
+        head_raw, head_rc = await _git_bytes(repo_path, "rev-parse", "HEAD")
+        head = head_raw.decode("ascii", "replace").strip() if head_rc == 0 else ""
+        head = head or None
+
+        commits = _load_cached_log(repo_path, head) if head else None
+        if commits is not None:
+            files_raw, _ = await _git_bytes(repo_path, "ls-files")
         else:
-            total_seconds += 3600  # Start new session assumption
+            (log_raw, log_rc), (files_raw, _) = await asyncio.gather(
+                _git_bytes(repo_path, *LOG_ARGS),
+                _git_bytes(repo_path, "ls-files"),
+            )
+            commits = _parse_log_bytes(log_raw)
+            if log_rc != 0:
+                # Match the sync path: report and never cache a partial log
+                print(f"git log failed for {repo_path} (exit {log_rc})")
+            elif head:
+                _store_cached_log(repo_path, head, commits)
 
-    return total_seconds / 3600
+    repo_name = os.path.basename(repo_path)
+    langs = _languages_from_listing(files_raw.decode("utf-8", "replace"))
+    return repo_name, commits, langs
+
+
+async def _mine_repos_async(repos):
+    sem = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+    return await asyncio.gather(*(_analyze_repo_async(r, sem) for r in repos))
+
+
+def _mine_repos(repos):
+    """Yields (repo_name, commits, langs) using the configured strategy."""
+    if USE_ASYNCIO:
+        yield from asyncio.run(_mine_repos_async(repos))
+    else:
+        # Repos are independent, so fan the git mining out across all cores.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            yield from ex.map(analyze_repo, repos, chunksize=4)
 
 
 def main():
     repos = get_git_repos(ROOT_DIR)
     print(f"✅ Found {len(repos)} repositories.")
 
-    all_commits = []
+    # Columnar (struct-of-arrays) accumulators: keys stored once in the
+    # JSON and pandas can build the DataFrame straight from the columns
+    commit_dates = []
+    commit_repos = []
+    commit_additions = []
+    commit_deletions = []
     language_counts = defaultdict(int)
     repo_totals = {}
 
     print("🚀 Mining commit history for Impact & Churn...")
 
-    for repo_path in repos:
-        repo_name = os.path.basename(repo_path)
-        print(f"   Analyzing {repo_name}...")
-
-        # 1. Get History (Time & Impact)
-        repo_commits = parse_git_log(repo_path)
+    for repo_name, repo_commits, repo_langs in _mine_repos(repos):
+        print(f"   Analyzed {repo_name}...")
 
-        for c in repo_commits:
-            # Flatten for easier pandas processing later
-            flat_commit = {
-                "date": c["date"],
-                "repo": repo_name,
-                "additions": c["additions"],
-                "deletions": c["deletions"],
-                "impact": c["additions"] + c["deletions"],
-            }
-            all_commits.append(flat_commit)
+        # 1. Get History (Time & Impact): bulk-extend the column
+        # accumulators from the per-repo columns
+        _hashes, dates, adds, dels = repo_commits
+        commit_dates.extend(dates)
+        commit_repos.extend([repo_name] * len(dates))
+        commit_additions.extend(adds)
+        commit_deletions.extend(dels)
 
         # 2. Get Snapshot (Languages)
-        repo_langs = get_current_languages(repo_path)
         for lang, count in repo_langs.items():
             language_counts[lang] += count
 
-        if len(repo_commits) > 0:
-            repo_totals[repo_name] = len(repo_commits)
+        if len(dates) > 0:
+            repo_totals[repo_name] = len(dates)
 
     # Calculate Global Stats
-    total_hours = estimate_hours(all_commits)
+    total_hours = estimate_hours(commit_dates)
 
     print("\n✨ Analysis Complete!")
-    print(f"   - {len(all_commits)} linked commits")
+    print(f"   - {len(commit_dates)} linked commits")
     print(f"   - {int(total_hours)} estimated hours of coding")
 
     export_data = {
-        "detailed_commits": all_commits,
+        "dates": commit_dates,
+        "repos": commit_repos,
+        "additions": commit_additions,
+        "deletions": commit_deletions,
         "languages": language_counts,
-        "repos": repo_totals,
+        "repo_totals": repo_totals,
         "total_hours_estimated": total_hours,
         "generated_at": datetime.now().isoformat(),
     }
 
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(export_data, f, indent=2)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
     print(f"💾 Saved deep-data to '{OUTPUT_FILE}'")
 
 